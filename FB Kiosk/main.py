@@ -24,7 +24,7 @@
           - Functions are used for GUI screens and utility behaviour.
       * Control structures: if/else for validation and logic, for-loops for rendering items,
         list comprehensions for filtering, try/except for file IO error handling.
-      * Data types: strings, integers, lists, dicts (CSV rows).
+      * Data types: strings, integers, lists, dicts, Item dataclass (CSV rows).
       * Data sources: CSV files used for persistent storage because they are simple, portable,
        and easy to use
 
@@ -37,14 +37,40 @@
 # 09/08/25 - Switched from Tkinter to CustomTkinter for better design
 # 15/08/25 - Added try/except to load_items and save_order
 # 16/08/25 - Replaced manual quantity input with +/- buttons for usability and validation
+# 15/10/26 - Cached load_items so the CSV is only read once per session
+# 15/10/26 - Cart now stores items in a dict keyed by name for constant-time lookups
+# 15/10/26 - View Items list only builds widgets for the rows on screen (VirtualList)
+# 15/10/26 - Cart and item rows are updated in place instead of being rebuilt every refresh
+# 15/10/26 - Search box waits for a pause in typing before re-rendering
+# 15/10/26 - Lowercase name/category/tag are worked out once in load_items for filtering
+# 15/10/26 - Added get_indexes so category/diet filters only scan matching rows
+# 15/10/26 - Items are sorted once in get_indexes, render_items no longer sorts
+# 15/10/26 - load_items now returns Item objects built in a single pass over the CSV
+# 15/10/26 - load_items uses pandas.read_csv when pandas is installed (falls back to csv module)
+# 15/10/26 - Moved filtering into filter_items, keyword check compiled with numba when it is installed
+# 15/10/26 - New cart rows are filled in first and packed together at the end of refresh_cart
+# 15/10/26 - validate_order_fields checks valid quantities with one precompiled regex
+# 15/10/26 - Items are loaded on a background thread at start up, View Items shows Loading... until ready
+# 15/10/26 - Row buttons use functools.partial callbacks instead of per-row lambdas
+# 15/10/26 - Quantity popups are built once per screen (QuantityPopup) and hidden/shown again
+# 15/10/26 - Sort order, lowercase columns and category/tag indexes combined into IndexedItems
+# 15/10/26 - Added Cart.get_qty so the Adjust popup doesn't copy the whole cart
+# 15/10/26 - Item and cart rows share CTkFont objects and style dicts instead of per-widget tuples
+# 15/10/26 - Keyword search scans one joined string (IndexedItems.corpus) with str.find
+# 15/10/26 - validate_order_fields takes an int quantity, text goes through validate_order_text
 
 #Importing
 import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime
+import bisect
 import csv
-from dataclasses import dataclass
-from typing import List, Tuple, Dict, Optional
+import functools
+import re
+import threading
+import warnings
+from dataclasses import dataclass, field
+from typing import List, Tuple, Dict, Optional, FrozenSet, Callable
 
 
 # Data classes & structures
@@ -54,29 +80,65 @@ class Item:
     name: str
     category: str
     tag: str = ""  # dietary tag 
+    # Lowercase copies used by the search/filter, worked out once when the item is created
+    name_lc: str = field(init=False, repr=False, compare=False)
+    category_lc: str = field(init=False, repr=False, compare=False)
+    tag_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.name_lc = self.name.lower()
+        self.category_lc = self.category.lower()
+        self.tag_lc = self.tag.lower()
     
 
+@dataclass(frozen=True)
+class IndexedItems:
+    #All items plus lookup tables built once, so filtering never lowercases or sorts.
+    rows: Tuple[Item, ...]                   # in CSV order, every index below refers to this
+    names_lc: Tuple[str, ...]                # lowercase columns, same order as rows
+    categories_lc: Tuple[str, ...]
+    tags_lc: Tuple[str, ...]
+    sorted_idx: Tuple[int, ...]              # row indices A → Z by name
+    by_category: Dict[str, FrozenSet[int]]   # lowercase category -> row indices
+    by_tag: Dict[str, FrozenSet[int]]        # lowercase dietary tag -> row indices
+    corpus: str                              # every row's "name_lc\x1ecategory_lc", joined by "\x1f"
+    corpus_starts: Tuple[int, ...]           # where each row starts in corpus
+
+    def match_keyword(self, keyword: str) -> FrozenSet[int]:
+        """
+        Row indices whose lowercase name or category contains keyword.
+        Uses str.find over the whole corpus (one C-level scan) instead of
+        testing every row, and skips to the next row after each hit.
+        """
+        matches = set()
+        pos = self.corpus.find(keyword)
+        while pos != -1:
+            row = bisect.bisect_right(self.corpus_starts, pos) - 1
+            matches.add(row)
+            if row + 1 >= len(self.corpus_starts):
+                break
+            pos = self.corpus.find(keyword, self.corpus_starts[row + 1])
+        return frozenset(matches)
+
+
 class Cart:
     """
     Cart behaviour.
-    Stores items as list of name or quantity
+    Stores items as a dict of name to quantity (keeps insertion order)
     Provides add/remove/adjust/clear operations with quantity caps.
     Encapsulates all cart stuff 
     """
     def __init__(self, max_per_item: int = 10):
-        self._items: List[Tuple[str, int]] = []
+        self._items: Dict[str, int] = {}
         self.max_per_item = max_per_item
 
     def to_list(self) -> List[Tuple[str, int]]:
         #Returns copy of cart contents for display.
-        return list(self._items)
+        return list(self._items.items())
 
-    def find_index(self, name: str) -> Optional[int]:
-        #Return index of item name in cart, or none if not there
-        for i, (n, q) in enumerate(self._items):
-            if n == name:
-                return i
-        return None
+    def get_qty(self, name: str) -> Optional[int]:
+        #Return quantity of item name in cart, or none if not there
+        return self._items.get(name)
 
     def add_item(self, name: str, qty: int = 1) -> Tuple[bool, str]:
         """
@@ -85,37 +147,29 @@ class Cart:
         """
         if qty < 1:
             return False, "Quantity must be at least 1."
-        idx = self.find_index(name)
-        if idx is None:
-            capped = min(qty, self.max_per_item)
-            self._items.append((name, capped))
+        existing_qty = self._items.get(name)
+        if existing_qty is None:
+            self._items[name] = min(qty, self.max_per_item)
             if qty > self.max_per_item:
                 return True, f"Added (capped at {self.max_per_item})."
             return True, "Added."
         else:
-            existing_qty = self._items[idx][1]
-            new_qty = min(existing_qty + qty, self.max_per_item)
-            self._items[idx] = (name, new_qty)
+            self._items[name] = min(existing_qty + qty, self.max_per_item)
             if existing_qty + qty > self.max_per_item:
                 return True, f"Updated (capped at {self.max_per_item})."
             return True, "Updated."
 
 #Remove an item by name. Returns True if removed.
     def remove_item(self, name: str) -> bool:
-        idx = self.find_index(name)
-        if idx is not None:
-            self._items.pop(idx)
-            return True
-        return False
+        return self._items.pop(name, None) is not None
 
 #Set quantity for an existing item within range 1.max_per_item.
     def adjust_quantity(self, name: str, qty: int) -> Tuple[bool, str]:
-        idx = self.find_index(name)
-        if idx is None:
+        if name not in self._items:
             return False, "Item not in cart."
         if qty < 1 or qty > self.max_per_item:
             return False, f"Quantity must be between 1 and {self.max_per_item}."
-        self._items[idx] = (name, qty)
+        self._items[name] = qty
         return True, "Quantity updated."
 
     def clear(self):
@@ -129,24 +183,41 @@ cart = Cart(max_per_item=10)
 
 
 #Loading items from CSV
-def load_items(csv_path: str = "data/items.csv") -> List[Dict[str, str]]:
+@functools.lru_cache(maxsize=1)
+def load_items(csv_path: str = "data/items.csv") -> List[Item]:
     """
-    Loads item rows from a CSV file and returns a list of dictionaries.
+    Loads item rows from a CSV file and returns a list of Item objects.
+    Uses pandas.read_csv if pandas is installed, otherwise csv.DictReader.
     Uses try/except to handle missing or corrupted files
     Returns an empty list if the file cannot be read.
+    The result (including the empty list on failure) is cached, so the file
+    is only read once per session. Call invalidate_items_cache() to reload.
     """
+    # pandas is optional, it only speeds up reading big CSV files. Imported here rather
+    # than at the top so it doesn't slow down opening the app (this runs on the loader thread)
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
     try:
+        if pd is not None:
+            # pandas parses the file in C; dtype=str/keep_default_na keep empty cells as ''.
+            # index_col=False stops a trailing comma on each row from turning the id column into the index;
+            # the extra empty field is dropped like csv.DictReader does, so its ParserWarning is silenced
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", pd.errors.ParserWarning)
+                    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False, index_col=False, encoding='utf-8')
+            except pd.errors.EmptyDataError:
+                return []  # empty file, same as the csv module path: no items
+            columns = [df[col] if col in df.columns else [''] * len(df) for col in ('name', 'category', 'tag')]
+            return [Item(name=n, category=c, tag=t) for n, c, t in zip(*columns)]
+
         with open(csv_path, newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            items = list(reader)
-            
-            for r in items:
-                # Guarantee keys exist to avoid KeyError in GUI rendering
-                r.setdefault('name', '')
-                r.setdefault('category', '')
-                r.setdefault('tag', '')
-              
-            return items
+            # Missing columns become '' so the GUI never has to check for them
+            return [Item(name=r.get('name') or '', category=r.get('category') or '', tag=r.get('tag') or '')
+                    for r in csv.DictReader(f)]
     except FileNotFoundError:
         print(f"[ERROR] items.csv not found at path: {csv_path}")
         return []
@@ -155,29 +226,202 @@ def load_items(csv_path: str = "data/items.csv") -> List[Dict[str, str]]:
         print(f"[ERROR] Failed to load items.csv: {e}")
         return []
 
-def validate_order_fields(item_name: str, quantity) -> Tuple[bool, str]:
+@functools.lru_cache(maxsize=1)
+def get_indexed_items(csv_path: str = "data/items.csv") -> IndexedItems:
+    """
+    Builds the IndexedItems for the rows from load_items(): the A → Z sort order,
+    the lowercase columns, the category/tag index sets and the search corpus.
+    Cached alongside load_items().
+    """
+    rows = tuple(load_items(csv_path))
+    # Control characters can't be typed into the search box, so keywords never match across fields/rows
+    fields = [item.name_lc + "\x1e" + item.category_lc for item in rows]
+    corpus_starts = []
+    start = 0
+    for text in fields:
+        corpus_starts.append(start)
+        start += len(text) + 1
+    by_category: Dict[str, set] = {}
+    by_tag: Dict[str, set] = {}
+    for i, item in enumerate(rows):
+        by_category.setdefault(item.category_lc, set()).add(i)
+        by_tag.setdefault(item.tag_lc, set()).add(i)
+    return IndexedItems(
+        rows=rows,
+        names_lc=tuple(item.name_lc for item in rows),
+        categories_lc=tuple(item.category_lc for item in rows),
+        tags_lc=tuple(item.tag_lc for item in rows),
+        sorted_idx=tuple(sorted(range(len(rows)), key=lambda i: rows[i].name_lc)),
+        by_category={k: frozenset(v) for k, v in by_category.items()},
+        by_tag={k: frozenset(v) for k, v in by_tag.items()},
+        corpus="\x1f".join(fields),
+        corpus_starts=tuple(corpus_starts),
+    )
+
+# Compiled keyword check set by build_numba_matcher(), as (the IndexedItems it was built for,
+# function(category_lc, diet_lc, keyword) -> frozenset of matching row indices)
+_numba_matcher: Optional[Tuple[IndexedItems, Callable]] = None
+
+def build_numba_matcher():
+    """
+    Compiles the keyword check with numba for the items from get_indexed_items(),
+    if numba is installed. numba/numpy are imported here rather than at the top
+    so they don't slow down opening the app. Runs on the background loader thread.
+    """
+    global _numba_matcher
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return
+
+    indexed = get_indexed_items()
+    if not indexed.rows:
+        return
+
+    @numba.njit(cache=True)
+    def match_keyword(text, lengths, candidates, keyword):
+        # The row indices in candidates whose text (a row of code points) contains keyword
+        keep = np.zeros(len(candidates), dtype=np.bool_)
+        k = len(keyword)
+        for j in range(len(candidates)):
+            row = text[candidates[j]]
+            for start in range(lengths[candidates[j]] - k + 1):
+                t = 0
+                while t < k and row[start + t] == keyword[t]:
+                    t += 1
+                if t == k:
+                    keep[j] = True
+                    break
+        return candidates[keep]
+
+    # Each row's "name_lc\x1ecategory_lc" as a fixed-width array of code points: numba compares
+    # plain integers much faster than it searches str objects (slower than CPython's own `in`).
+    # The category/tag index sets are also turned into sorted arrays once here rather than on every search
+    fields = [name + "\x1e" + category for name, category in zip(indexed.names_lc, indexed.categories_lc)]
+    width = max(max(map(len, fields)), 1)
+    text = np.array(fields, dtype=f"<U{width}").view(np.uint32).reshape(len(fields), width)
+    lengths = np.array([len(f) for f in fields], dtype=np.int64)
+    category_arrays = {k: np.array(sorted(v), dtype=np.int64) for k, v in indexed.by_category.items()}
+    tag_arrays = {k: np.array(sorted(v), dtype=np.int64) for k, v in indexed.by_tag.items()}
+    no_rows = np.zeros(0, dtype=np.int64)
+
+    def matcher(category_lc: str, diet_lc: str, keyword: str) -> FrozenSet[int]:
+        #Row indices in the selected category and/or diet whose name or category contains keyword
+        candidates = None
+        for arrays, value in ((category_arrays, category_lc), (tag_arrays, diet_lc)):
+            if value:
+                matching = arrays.get(value, no_rows)
+                candidates = matching if candidates is None else np.intersect1d(candidates, matching, assume_unique=True)
+        keyword_codes = np.frombuffer(keyword.encode("utf-32-le"), dtype=np.uint32)
+        return frozenset(match_keyword(text, lengths, candidates, keyword_codes).tolist())
+
+    matcher(indexed.rows[0].category_lc, "", "a")  # compile now rather than on the first search
+    _numba_matcher = (indexed, matcher)
+
+def invalidate_items_cache():
+    #Forget the cached CSV rows so the next load_items() call re-reads the file.
+    global _numba_matcher
+    load_items.cache_clear()
+    get_indexed_items.cache_clear()
+    _numba_matcher = None  # filter_items uses the Python search until build_numba_matcher() runs again
+
+# Set once the background loader has filled the item caches (see warm_item_caches)
+items_ready = threading.Event()
+
+def warm_item_caches():
+    """
+    Loads the CSV and builds the indexes ahead of time, then compiles the numba
+    filter. Runs on a background thread. items_ready is set as soon as the indexes
+    exist: compiling can take seconds on first launch, and until it finishes
+    filter_items simply uses the Python search.
+    """
+    try:
+        get_indexed_items()
+    finally:
+        items_ready.set()
+    build_numba_matcher()
+
+def filter_items(keyword: str, category: str = "All", diet: str = "All", reverse: bool = False) -> List[Item]:
+    """
+    Returns the items whose name or category contains keyword (lowercase),
+    limited to one category and/or dietary tag unless "All" is given.
+    Results are A → Z by name, or Z → A if reverse is True.
+    """
+    indexed = get_indexed_items()
+    rows = indexed.rows
+    category_lc = "" if category == "All" else category.lower()
+    diet_lc = "" if diet == "All" else diet.lower()
+
+    # Walking the precomputed A → Z order (or backwards for Z → A) means nothing is sorted here
+    order = reversed(indexed.sorted_idx) if reverse else indexed.sorted_idx
+
+    # Row indices allowed by the category/diet filters (None means every row)
+    allowed: Optional[FrozenSet[int]] = None
+    for index, value in ((indexed.by_category, category_lc), (indexed.by_tag, diet_lc)):
+        if value:
+            matching = index.get(value, frozenset())
+            allowed = matching if allowed is None else allowed & matching
+
+    numba_matcher = _numba_matcher
+    if keyword and allowed is None:
+        # No category/diet filter: one str.find scan over the joined corpus
+        allowed = indexed.match_keyword(keyword)
+    elif keyword and numba_matcher is not None and numba_matcher[0] is indexed:
+        # Compiled loop over the selected category/diet rows, using arrays built by build_numba_matcher()
+        allowed = numba_matcher[1](category_lc, diet_lc, keyword)
+    elif keyword:
+        # Only the rows left by the category/diet filters need checking (usually far fewer than the corpus)
+        names_lc, categories_lc = indexed.names_lc, indexed.categories_lc
+        allowed = frozenset(i for i in allowed if keyword in names_lc[i] or keyword in categories_lc[i])
+
+    if allowed is None:
+        return [rows[i] for i in order]
+    return [rows[i] for i in order if i in allowed]
+
+@functools.lru_cache(maxsize=None)
+def _quantity_pattern(max_qty: int) -> re.Pattern:
+    #Regex matching a whole number from 1 to max_qty (leading zeros and spaces allowed), built once per max.
+    numbers = "|".join(str(q) for q in range(max_qty, 0, -1))
+    return re.compile(rf"\s*0*(?:{numbers})\s*")
+
+def validate_order_fields(item_name: str, quantity: int) -> Tuple[bool, str]:
     """
     Validates order fields with explicit existence, type or range checks.
     - Existence check: item_name must not be empty.
-    - Type check: quantity must be an integer (or numeric string convertible to int).
+    - Type check: quantity must be an integer (the popups pass qty_var.get(), already an int).
     - Range check: 1 less than or equal to quantity less than or equal to cart.max_per_item
+    Use validate_order_text() for a quantity given as text.
     Returns (is_valid, message).
     """
-    if not item_name or not str(item_name).strip():
+    if not item_name or item_name.isspace():
         return False, "Item name is required."
 
-    # Type check: allow numeric strings too
-    q_str = str(quantity).strip()
-    if not q_str.isdigit():
+    # bool is a subclass of int, so check the exact type
+    if type(quantity) is not int:
         return False, "Quantity must be a whole number."
-
-    q = int(q_str)
-    if q <= 0:
+    if quantity <= 0:
         return False, "Quantity must be greater than zero."
-    if q > cart.max_per_item:
+    if quantity > cart.max_per_item:
         return False, f"Quantity must be no more than {cart.max_per_item}."
     return True, ""
 
+def validate_order_text(item_name: str, quantity_text: str) -> Tuple[bool, str]:
+    """
+    Thin wrapper for a quantity typed as text (e.g. " 3 "), same checks and messages
+    as validate_order_fields(). A valid quantity is accepted by one precompiled
+    regex match; the text is only picked apart to choose the message when it is invalid.
+    """
+    if _quantity_pattern(cart.max_per_item).fullmatch(quantity_text):
+        return validate_order_fields(item_name, int(quantity_text))  # int() allows the spaces and leading zeros
+
+    q_str = quantity_text.strip()
+    if q_str.isascii() and q_str.isdigit():
+        return validate_order_fields(item_name, int(q_str))  # a whole number, but out of range
+    if not item_name or item_name.isspace():
+        return False, "Item name is required."
+    return False, "Quantity must be a whole number."
+
 
 
 # GUI Configuration
@@ -193,6 +437,154 @@ BACKGROUND_COLOR = "#f5f5f5"
 TEXT_FONT = ("Segoe UI", 12)
 TITLE_FONT = ("Segoe UI", 18, "bold")
 
+# Widget styles shared by the item and cart rows (spread into the widgets with **)
+ITEM_ROW_STYLE = dict(fg_color="white", corner_radius=20)
+CART_ROW_STYLE = dict(fg_color="#f6f6f6", corner_radius=10)
+GREEN_BUTTON_STYLE = dict(fg_color="#2E8B57", hover_color="#256D4A")
+REMOVE_BUTTON_STYLE = dict(fg_color="orange", hover_color="#e67e22")
+
+# Every row in the View Items list has the same height (including the gap
+# between rows) so the visible rows can be worked out from the scroll position
+ITEM_ROW_HEIGHT = 160
+ITEM_ROW_GAP = 24
+
+# Delay (ms) after the last key press before the search re-renders
+SEARCH_DEBOUNCE_MS = 150
+
+
+class VirtualList:
+    """
+    Scrollable list that only creates widgets for the rows currently on screen.
+    A spacer frame is sized for every row so the scrollbar still behaves
+    normally, and a small pool of row widgets is moved to the visible
+    positions and refilled as the user scrolls.
+    build_row(parent) creates one empty row widget, fill_row(widget, data)
+    shows a data row in it.
+    """
+    def __init__(self, scroll_frame, row_height: int, build_row, fill_row):
+        self.canvas = scroll_frame._parent_canvas
+        self.row_height = row_height
+        self.build_row = build_row
+        self.fill_row = fill_row
+        self.rows: list = []
+        self._pool = []
+        self._shown: Optional[Tuple[int, int]] = None  # (first, last) rows currently placed
+        self._poll_id = None
+
+        self.spacer = ctk.CTkFrame(scroll_frame, height=1, fg_color="transparent")
+        self.spacer.pack(fill="x")
+        self.spacer.bind("<Destroy>", lambda e: self._stop_polling(), add="+")
+        self._poll()
+
+    def set_rows(self, rows: list):
+        #Show a new list of rows, starting from the top.
+        self.rows = rows
+        self.spacer.configure(height=max(len(rows) * self.row_height, 1))
+        self.canvas.yview_moveto(0)
+        self._shown = None
+        self._layout()
+
+    def _poll(self):
+        # Checking the scroll position on a timer is cheaper than reacting to every scroll event
+        self._layout()
+        self._poll_id = self.spacer.after(16, self._poll)
+
+    def _stop_polling(self):
+        if self._poll_id is not None:
+            self.spacer.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def _layout(self):
+        #Place pooled row widgets over the rows that are currently visible.
+        row_px = self.row_height * ctk.ScalingTracker.get_widget_scaling(self.spacer)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(int(top // row_px), 0)
+        last = min(int(bottom // row_px) + 1, len(self.rows))
+        if (first, last) == self._shown:
+            return
+        self._shown = (first, last)
+
+        while len(self._pool) < last - first:
+            self._pool.append(self.build_row(self.spacer))
+
+        for slot, widget in enumerate(self._pool):
+            index = first + slot
+            if index < last:
+                self.fill_row(widget, self.rows[index])
+                widget.place(relx=0.01, relwidth=0.98, y=index * self.row_height)
+            else:
+                widget.place_forget()
+
+class QuantityPopup:
+    """
+    Popup with -/+ buttons for picking a quantity from 1 to cart.max_per_item.
+    Built once per screen, then hidden with withdraw() and shown again with
+    show() instead of creating a new window every time (slow and flickers).
+    on_confirm(qty) is called by the confirm button and returns an error
+    message to show, or "" to close the popup.
+    """
+    def __init__(self, parent, confirm_text: str, prompt_font_size: int = 18):
+        self.parent = parent
+        self.window = ctk.CTkToplevel(parent)
+        self.window.geometry("300x230")
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)  # closing just hides it for next time
+        self._on_confirm = None
+
+        self.qty_var = ctk.IntVar(value=1)
+        self.warning_label = ctk.CTkLabel(self.window, text="", text_color="red")
+        self.warning_label.pack(pady=(5, 0))
+
+        self.prompt_label = ctk.CTkLabel(self.window, text="", font=("Segoe UI", prompt_font_size, "bold"))
+        self.prompt_label.pack(pady=8)
+        qty_frame = ctk.CTkFrame(self.window, fg_color="transparent")
+        qty_frame.pack()
+#plus-minus layout 
+        ctk.CTkButton(qty_frame, text="-", width=40, command=self.decrease).pack(side="left", padx=5)
+        ctk.CTkLabel(qty_frame, textvariable=self.qty_var, font=("Segoe UI", 18)).pack(side="left", padx=5)
+        ctk.CTkButton(qty_frame, text="+", width=40, command=self.increase).pack(side="left", padx=5)
+
+        ctk.CTkButton(self.window, text=confirm_text, command=self.confirm,
+                      **GREEN_BUTTON_STYLE).pack(pady=12)
+
+    def show(self, title: str, prompt: str, qty: int, on_confirm):
+        #Reset the popup for a new item and bring it back on screen.
+        self.window.title(title)
+        self.prompt_label.configure(text=prompt)
+        self.warning_label.configure(text="")
+        self.qty_var.set(qty)
+        self._on_confirm = on_confirm
+        self.window.deiconify()
+        self.window.lift()
+        self.window.grab_set()
+
+    def hide(self):
+        self.window.grab_release()
+        self.window.withdraw()
+        self.parent.grab_set()  # the screen underneath is modal again
+
+#Increasing item quantity
+    def increase(self):
+        if self.qty_var.get() < cart.max_per_item:
+            self.qty_var.set(self.qty_var.get() + 1)
+            self.warning_label.configure(text="")
+        else:
+            self.warning_label.configure(text=f"Max limit is {cart.max_per_item} per item.")
+
+#Decreasing item quantity
+    def decrease(self):
+        if self.qty_var.get() > 1:
+            self.qty_var.set(self.qty_var.get() - 1)
+            self.warning_label.configure(text="")
+
+    def confirm(self):
+        msg = self._on_confirm(self.qty_var.get())
+        if msg:
+            self.warning_label.configure(text=msg)
+            return
+        self.hide()
+
 # GUI Screens or Functions
 
 def show_items_window():
@@ -250,110 +642,145 @@ def show_items_window():
     # List area
     list_frame = ctk.CTkScrollableFrame(item_window, height=1000, fg_color=BACKGROUND_COLOR)
     list_frame.pack(fill="both", expand=True, padx=40)
+    empty_label = ctk.CTkLabel(list_frame, text="No items found.", font=("Segoe UI", 18, "bold"), text_color="red")
 
     feedback_label = ctk.CTkLabel(item_window, text="", text_color="green", font=("Segoe UI", 18, "bold"))
     feedback_label.pack(pady=5)
 
-    def open_quantity_popup(name: str, parent_button):
+    qty_popup: Optional[QuantityPopup] = None
+    # Items added since the last render; their rows show "Added!" (cleared by render_items like before pooling)
+    added_names = set()
+
+    def open_quantity_popup(name: str, row):
         """
         Opens a popup to select quantity. This uses the Cart class for validation and capping.
         The popup ensures type/range/existence checks and provides feedback to the user.
+        The popup window is created on first use and reused afterwards.
         """
-        qty_window = ctk.CTkToplevel(item_window)
-        qty_window.title("Select Quantity")
-        qty_window.geometry("300x230")
-        qty_window.transient(item_window)
-        qty_window.grab_set()
-
-        qty_var = ctk.IntVar(value=1)
-        warning_label = ctk.CTkLabel(qty_window, text="", text_color="red")
-        warning_label.pack(pady=(5, 0))
-
-        ctk.CTkLabel(qty_window, text=f"How many {name}?", font=("Segoe UI", 18, "bold")).pack(pady=8)
-        qty_frame = ctk.CTkFrame(qty_window, fg_color="transparent")
-        qty_frame.pack()
-#Increasing item quantity
-        def increase():
-            if qty_var.get() < cart.max_per_item:
-                qty_var.set(qty_var.get() + 1)
-                warning_label.configure(text="")
-            else:
-                warning_label.configure(text=f"Max limit is {cart.max_per_item} per item.")
-#Decreasing item quantity
-        def decrease():
-            if qty_var.get() > 1:
-                qty_var.set(qty_var.get() - 1)
-                warning_label.configure(text="")
-#plus-minus layout 
-        ctk.CTkButton(qty_frame, text="-", width=40, command=decrease).pack(side="left", padx=5)
-        ctk.CTkLabel(qty_frame, textvariable=qty_var, font=("Segoe UI", 18)).pack(side="left", padx=5)
-        ctk.CTkButton(qty_frame, text="+", width=40, command=increase).pack(side="left", padx=5)
+        nonlocal qty_popup
+        if qty_popup is None:
+            qty_popup = QuantityPopup(item_window, "Add to Cart")
 #confirming order
-        def confirm():
-            q = qty_var.get()
+        def confirm(q: int) -> str:
             valid, msg = validate_order_fields(name, q)
             if not valid:
-                warning_label.configure(text=msg)
-                return
+                return msg
             success, add_msg = cart.add_item(name, q)
             feedback_label.configure(text=f"{q} × {name} added to cart!", text_color="green")
-            parent_button.configure(text="Added!", fg_color="#228B22", hover_color="#1E7B1E")
-            qty_window.destroy() #closes window after click
-#add to cart button
-        ctk.CTkButton(qty_window, text="Add to Cart", command=confirm,
-                      fg_color="#2E8B57", hover_color="#256D4A").pack(pady=12)
+            added_names.add(name)
+            if row.item_name == name:
+                show_add_state(row)
+            return ""  # closes window after click
+
+        qty_popup.show("Select Quantity", f"How many {name}?", 1, confirm)
+#Builds one reusable row for the item list (filled in by fill_item_row)
+    def build_item_row(parent):
+        frame = ctk.CTkFrame(parent, **ITEM_ROW_STYLE, height=ITEM_ROW_HEIGHT - ITEM_ROW_GAP)
+        frame.pack_propagate(False)  # keep every row the same height
+
+        frame.name_label = ctk.CTkLabel(frame, text="", text_color=HEADER_COLOR)
+        frame.name_label.pack(anchor="w", padx=20, pady=(10, 2))
+        frame.details_label = ctk.CTkLabel(frame, text="", font=ROW_DETAIL_FONT, text_color="#555555")
+        frame.details_label.pack(anchor="w", padx=20)
+        frame.add_btn = ctk.CTkButton(frame, text="Add", **GREEN_BUTTON_STYLE, text_color="white")
+        frame.add_btn.pack(anchor="e", padx=10, pady=10)
+        frame.item = None  # the Item shown, compared by identity so rows with the same name still relabel
+        frame.item_name = None
+        frame.shows_added = False
+        return frame
+
+#Shows "Added!" on a row's button if its item is in added_names, otherwise "Add"
+    def show_add_state(frame):
+        added = frame.item_name in added_names
+        if frame.shows_added == added:
+            return
+        frame.shows_added = added
+        if added:
+            frame.add_btn.configure(text="Added!", fg_color="#228B22", hover_color="#1E7B1E")
+        else:
+            frame.add_btn.configure(text="Add", **GREEN_BUTTON_STYLE)
+
+#Shows one item in a pooled row widget
+    def fill_item_row(frame, item: Item):
+        item_name = item.name
+        # Only relabel the row if it was showing another item
+        if frame.item is not item:
+            frame.item = item
+            frame.item_name = item_name
+            title_font = ROW_TITLE_FONT_LARGE if item.name_lc == "apples" else ROW_TITLE_FONT
+            frame.name_label.configure(text=item_name, font=title_font)
+
+            details_text = f"Category: {item.category}"
+            if item.tag:
+                details_text += f"    Diet: {item.tag}"
+            frame.details_label.configure(text=details_text)
+            frame.add_btn.configure(command=functools.partial(open_quantity_popup, item_name, frame))
+
+        # The button is checked every time, so "Added!" is cleared on the next render
+        show_add_state(frame)
+
+    item_list = VirtualList(list_frame, ITEM_ROW_HEIGHT, build_item_row, fill_item_row)
+
 #Load, filter, sort and render items in the list_frame.
+    loading_poll_id = None
+
     def render_items():
-        
-        for w in list_frame.winfo_children():
-            w.destroy()
+        nonlocal loading_poll_id
         feedback_label.configure(text="")
+        added_names.clear()
+
+        # Items are still loading in the background, check again shortly
+        if not items_ready.is_set():
+            empty_label.configure(text="Loading items...")
+            empty_label.pack(pady=20)
+            if loading_poll_id is None:
+                loading_poll_id = item_window.after(50, poll_loading)
+            return
 
-        items = load_items()
         keyword = search_var.get().strip().lower()  # CHANGED: strip() removes whitespace in search
+        filtered = filter_items(keyword, category_var.get(), dietary_var.get(), reverse=sort_var.get() == "Z → A")
 
-        sort_by = sort_var.get()
-        selected_category = category_var.get()
-        selected_diet = dietary_var.get()
+        if not filtered:
+            empty_label.configure(text="No items found.")
+            empty_label.pack(pady=20)
+        else:
+            empty_label.pack_forget()
 
-        # Filtering existence checks for fields are handled in load_items()
-        filtered = [
-            item for item in items
-            if (keyword in item.get('name', '').lower() or keyword in item.get('category', '').lower())
-            and (selected_category == "All" or item.get('category', '') == selected_category)
-            and (selected_diet == "All" or (item.get('tag') and item['tag'].lower() == selected_diet.lower()))
-        ]
+        # Only the rows on screen get widgets, the rest are drawn as the user scrolls
+        item_list.set_rows(filtered)
 
-        # Sorting from alphabetical order and reverse
-        if sort_by == "A → Z":
-            filtered.sort(key=lambda x: x.get('name', '').lower())
-        elif sort_by == "Z → A":
-            filtered.sort(key=lambda x: x.get('name', '').lower(), reverse=True)
+    def poll_loading():
+        nonlocal loading_poll_id
+        loading_poll_id = None
+        render_items()
 
-        if not filtered:
-            ctk.CTkLabel(list_frame, text="No items found.", font=("Segoe UI", 18, "bold"), text_color="red").pack(pady=20)
-            return
+    search_after_id = None
 
-        # Render each item
-        for item_row in filtered:
-            frame = ctk.CTkFrame(list_frame, fg_color="white", corner_radius=20)
-            frame.pack(fill="x", padx=10, pady=12)
+    def on_search_key(event):
+        #Restart the timer on each key so a burst of typing only renders once
+        nonlocal search_after_id
+        if search_after_id is not None:
+            item_window.after_cancel(search_after_id)
+        search_after_id = item_window.after(SEARCH_DEBOUNCE_MS, run_search)
 
-            item_name = item_row.get('name', '')
-            font_size = 28 if item_name.lower() == "apples" else 22
-            ctk.CTkLabel(frame, text=item_name, font=("Segoe UI", font_size, "bold"), text_color=HEADER_COLOR).pack(anchor="w", padx=20, pady=(10, 2))
+    def run_search():
+        nonlocal search_after_id
+        search_after_id = None
+        render_items()
 
-            details_text = f"Category: {item_row.get('category', '')}"
-            if item_row.get('tag'):
-                details_text += f"    Diet: {item_row.get('tag')}"
-            ctk.CTkLabel(frame, text=details_text, font=("Segoe UI", 16), text_color="#555555").pack(anchor="w", padx=20)
+    def on_item_window_destroy(event):
+        # <Destroy> on a window also fires for every widget inside it, only act on the window itself
+        if event.widget is not item_window:
+            return
+        # A pending search or loading check would otherwise render into the destroyed widgets
+        for after_id in (search_after_id, loading_poll_id):
+            if after_id is not None:
+                item_window.after_cancel(after_id)
 
-            add_btn = ctk.CTkButton(frame, text="Add", fg_color="#2E8B57", hover_color="#256D4A", text_color="white")
-            add_btn.configure(command=lambda nm=item_name, btn=add_btn: open_quantity_popup(nm, btn))
-            add_btn.pack(anchor="e", padx=10, pady=10)
+    item_window.bind("<Destroy>", on_item_window_destroy, add="+")
 
-    # Bindings
-    search_entry.bind("<KeyRelease>", lambda e: render_items())
+    # Bindings (dropdowns and radio buttons are single clicks so they render straight away)
+    search_entry.bind("<KeyRelease>", on_search_key)
     sort_var.trace_add("write", lambda *args: render_items())
     category_var.trace_add("write", lambda *args: render_items())
     dietary_var.trace_add("write", lambda *args: render_items())
@@ -387,73 +814,72 @@ def show_order_window():
     message_label = ctk.CTkLabel(content, text="", font=TEXT_FONT)
     message_label.pack(pady=(5, 0))
 
+    empty_label = ctk.CTkLabel(cart_frame, text="Cart is empty.", font=("Segoe UI", 20, "bold"), text_color="red")
+    cart_rows: Dict[str, ctk.CTkFrame] = {}  # item name -> row widget currently shown
+
+    def on_remove(n: str):
+        removed = cart.remove_item(n)
+        refresh_cart()
+        if removed:
+            message_label.configure(text=f"{n} removed.", text_color="orange", font=("Segoe UI", 20,))
+
+    adjust_popup: Optional[QuantityPopup] = None
+
+    def on_adjust(n: str):
+        # Popup to adjust quantity for this item (created on first use, then reused)
+        nonlocal adjust_popup
+        if adjust_popup is None:
+            adjust_popup = QuantityPopup(order_window, "Confirm", prompt_font_size=16)
+
+        def confirm_adj(q: int) -> str:
+            ok, msg = cart.adjust_quantity(n, q)
+            if not ok:
+                return msg
+            refresh_cart()
+            message_label.configure(text=f"{n} quantity updated.", text_color="green", font=("Segoe UI", 20,))
+            return ""
+
+        adjust_popup.show(f"Adjust Quantity - {n}", f"Adjust quantity for {n}",
+                          cart.get_qty(n) or 1, confirm_adj)
+
+    def build_cart_row(name: str):
+        #Creates the row for one cart item (not packed yet), the quantity text is set by refresh_cart
+        row = ctk.CTkFrame(cart_frame, **CART_ROW_STYLE)
+
+        row.qty_label = ctk.CTkLabel(row, text="", font=CART_ROW_FONT)
+        row.qty_label.pack(side="left", padx=20)
+
+        ctk.CTkButton(row, text="Remove", command=functools.partial(on_remove, name), **REMOVE_BUTTON_STYLE).pack(side="right", padx=6)
+        ctk.CTkButton(row, text="Adjust Quantity", command=functools.partial(on_adjust, name), **GREEN_BUTTON_STYLE).pack(side="right", padx=6)
+        return row
+
     def refresh_cart():
-        #Re-render cart contents from Cart.to_list().
-        for widget in cart_frame.winfo_children():
-            widget.destroy()
+        #Sync cart rows with Cart.to_list(), only touching rows that changed.
+        items = dict(cart.to_list())
+
+        for name in list(cart_rows):
+            if name not in items:
+                cart_rows.pop(name).destroy()
 
-        items = cart.to_list()
         if not items:
-            ctk.CTkLabel(cart_frame, text="Cart is empty.", font=("Segoe UI", 20, "bold"), text_color="red").pack(pady=20)
+            empty_label.pack(pady=20)
             return
-
-        for idx, (name, qty) in enumerate(items):
-            row = ctk.CTkFrame(cart_frame, fg_color="#f6f6f6", corner_radius=10)
+        empty_label.pack_forget()
+
+        new_rows = []
+        for name, qty in items.items():
+            row = cart_rows.get(name)
+            if row is None:
+                row = cart_rows[name] = build_cart_row(name)
+                new_rows.append(row)
+            text = f"{name} x {qty}"
+            if row.qty_label.cget("text") != text:
+                row.qty_label.configure(text=text)
+
+        # Pack new rows only once they are filled in so the cart is laid out in one go.
+        # New items are always added to the end of the cart, so packing them last keeps the order
+        for row in new_rows:
             row.pack(fill="x", pady=8, padx=8)
-
-            ctk.CTkLabel(row, text=f"{name} x {qty}", font=("Segoe UI", 18)).pack(side="left", padx=20)
-
-            def on_remove(i=idx, n=name):
-                removed = cart.remove_item(n)
-                refresh_cart()
-                if removed:
-                    message_label.configure(text=f"{n} removed.", text_color="orange", font=("Segoe UI", 20,))
-
-            def on_adjust(i=idx, n=name):
-                # Popup to adjust quantity for this item
-                adj_win = ctk.CTkToplevel(order_window)
-                adj_win.title(f"Adjust Quantity - {n}")
-                adj_win.geometry("300x230")
-                adj_win.transient(order_window)
-                adj_win.grab_set()
-
-                qty_var = ctk.IntVar(value=cart.to_list()[i][1])
-                alert = ctk.CTkLabel(adj_win, text="", text_color="red")
-                alert.pack(pady=(5, 0))
-                ctk.CTkLabel(adj_win, text=f"Adjust quantity for {n}", font=("Segoe UI", 16, "bold")).pack(pady=10)
-
-                frameq = ctk.CTkFrame(adj_win, fg_color="transparent")
-                frameq.pack(pady=8)
-
-                def inc():
-                    if qty_var.get() < cart.max_per_item:
-                        qty_var.set(qty_var.get() + 1)
-                        alert.configure(text="")
-                    else:
-                        alert.configure(text=f"Max is {cart.max_per_item}")
-
-                def dec():
-                    if qty_var.get() > 1:
-                        qty_var.set(qty_var.get() - 1)
-                        alert.configure(text="")
-
-                ctk.CTkButton(frameq, text="-", width=40, command=dec).pack(side="left", padx=5)
-                ctk.CTkLabel(frameq, textvariable=qty_var, font=("Segoe UI", 18)).pack(side="left", padx=6)
-                ctk.CTkButton(frameq, text="+", width=40, command=inc).pack(side="left", padx=5)
-
-                def confirm_adj():
-                    ok, msg = cart.adjust_quantity(n, qty_var.get())
-                    if not ok:
-                        alert.configure(text=msg)
-                        return
-                    refresh_cart()
-                    adj_win.destroy()
-                    message_label.configure(text=f"{n} quantity updated.", text_color="green", font=("Segoe UI", 20,))
-
-                ctk.CTkButton(adj_win, text="Confirm", command=confirm_adj, fg_color="#2E8B57", hover_color="#256D4A").pack(pady=10)
-
-            ctk.CTkButton(row, text="Remove", command=on_remove, fg_color="orange", hover_color="#e67e22").pack(side="right", padx=6)
-            ctk.CTkButton(row, text="Adjust Quantity", command=on_adjust, fg_color="#2E8B57", hover_color="#256D4A").pack(side="right", padx=6)
 #validation for submitting with an empty cart and submitting with a valid cart 
     def submit_order_action():
         if cart.is_empty():
@@ -515,6 +941,13 @@ root.title("FoodBank Kiosk")
 root.geometry("1200x720")
 root.configure(fg_color=BACKGROUND_COLOR)
 
+# Fonts shared by every item and cart row. CTkFont needs the root window to exist,
+# so these are created here rather than with the other constants
+ROW_TITLE_FONT = ctk.CTkFont(family="Segoe UI", size=22, weight="bold")
+ROW_TITLE_FONT_LARGE = ctk.CTkFont(family="Segoe UI", size=28, weight="bold")
+ROW_DETAIL_FONT = ctk.CTkFont(family="Segoe UI", size=16)
+CART_ROW_FONT = ctk.CTkFont(family="Segoe UI", size=18)
+
 # Title
 ctk.CTkLabel(root, text="FoodBank Kiosk", font=("Segoe UI", 36, "bold"), text_color=HEADER_COLOR).pack(pady=30)
 
@@ -539,5 +972,8 @@ ctk.CTkButton(root, text="Exit", command=root.destroy,
 ctk.CTkLabel(root, text="Serving since 2025 | FoodBank Kiosk", font=("Segoe UI", 14), text_color="#666666").pack(side="bottom", pady=8)
 
 
+# Read the CSV while the main menu is showing so View Items opens straight away
+threading.Thread(target=warm_item_caches, daemon=True).start()
+
 # Launch app
 root.mainloop()